@@ -0,0 +1,108 @@
+"""Track cold start latency of the ETL entry points.
+
+Each measurement runs in a fresh interpreter so nothing is already imported or
+cached. Run from the etl directory:
+
+    python benchmark_startup.py
+    python benchmark_startup.py --first-task  # needs Prefect blocks and network
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ENTRY_MODULES = [
+    "master_flow",
+    "bus_live_locations",
+    "compare_bus_times",
+    "write_to_bq",
+    "bus_timetables",
+]
+
+# Dependencies that should only load on the code path that uses them
+HEAVY_MODULES = [
+    "pandas",
+    "numpy",
+    "gtfs_kit",
+    "google.transit.gtfs_realtime_pb2",
+    "google.cloud.bigquery",
+    "google.cloud.storage",
+    "prefect_gcp",
+]
+
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+FIRST_TASK_SNIPPET = """
+import json, os, time
+start = time.perf_counter()
+from bus_live_locations import get_live_gtfs
+imported = time.perf_counter()
+timings = []
+for _ in range(2):
+    t = time.perf_counter()
+    get_live_gtfs.fn(53.725, 53.938, -1.712, -1.296, filename="benchmark_live")
+    timings.append(time.perf_counter() - t)
+os.remove("benchmark_live.parquet.gzip")
+print(json.dumps({"import": imported - start, "cold": timings[0], "warm": timings[1]}))
+"""
+
+
+def run_snippet(snippet: str) -> dict:
+    """Run a snippet in a fresh interpreter and return the JSON it prints"""
+
+    result = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark_imports(repeats: int) -> None:
+    """Report the median import time of each entry module"""
+
+    print(f"{'module':<20} {'median ms':>10}  heavy modules loaded at import")
+    for module in ENTRY_MODULES:
+        runs = [
+            run_snippet(IMPORT_SNIPPET.format(module=module, heavy=HEAVY_MODULES))
+            for _ in range(repeats)
+        ]
+        median = statistics.median(r["seconds"] for r in runs) * 1000
+        heavy = ", ".join(runs[-1]["heavy"]) or "-"
+        print(f"{module:<20} {median:>10.1f}  {heavy}")
+
+
+def benchmark_first_task() -> None:
+    """Report import, first and second call latency of the live feed task"""
+
+    timings = run_snippet(FIRST_TASK_SNIPPET)
+    print(f"\n{'get_live_gtfs':<20} {'ms':>10}")
+    for name, seconds in timings.items():
+        print(f"{name:<20} {seconds * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--first-task",
+        action="store_true",
+        help="also time the first live feed task call (loads the BODS secret)",
+    )
+    args = parser.parse_args()
+
+    benchmark_imports(args.repeats)
+    if args.first_task:
+        benchmark_first_task()
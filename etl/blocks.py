@@ -0,0 +1,38 @@
+from functools import lru_cache
+
+
+# Blocks are loaded on first use and cached for the life of the process, so a
+# warm Cloud Run container skips the Prefect API round trips on later runs.
+# Failed loads raise and are not cached, so task retries still hit the API.
+
+
+@lru_cache(maxsize=None)
+def load_bods_api_key() -> str:
+    """Get the Open Bus Data API key from its Prefect Secret block"""
+
+    from prefect.blocks.system import Secret
+
+    # For local env variable instead of Prefect Cloud
+    # env_path = Path(".") / ".env"
+    # load_dotenv(dotenv_path=env_path)
+    # return os.environ["BODS_API"]
+
+    return Secret.load("bods-api-key").get()
+
+
+@lru_cache(maxsize=None)
+def load_gcs_bucket(pref_gcs_block_name: str):
+    """Get the Prefect GcsBucket block with the given name"""
+
+    from prefect_gcp.cloud_storage import GcsBucket
+
+    return GcsBucket.load(pref_gcs_block_name)
+
+
+@lru_cache(maxsize=None)
+def load_gcp_credentials(pref_gcp_creds_block_name: str):
+    """Get the Prefect GcpCredentials block with the given name"""
+
+    from prefect_gcp import GcpCredentials
+
+    return GcpCredentials.load(pref_gcp_creds_block_name)
@@ -0,0 +1,70 @@
+from typing import List, Tuple
+
+
+# (name, field_type, mode) of each raw_late_buses column, in late_buses.csv order
+LATE_BUSES_FIELDS: List[Tuple[str, str, str]] = [
+    ("route_id", "INTEGER", "REQUIRED"),
+    ("service_id", "INTEGER", "REQUIRED"),
+    ("trip_id", "STRING", "REQUIRED"),
+    ("trip_headsign", "STRING", "REQUIRED"),
+    ("block_id", "STRING", "REQUIRED"),
+    ("shape_id", "STRING", "REQUIRED"),
+    ("wheelchair_accessible", "INTEGER", "REQUIRED"),
+    ("vehicle_journey_code", "STRING", "REQUIRED"),
+    ("agency_id", "STRING", "REQUIRED"),
+    ("route_short_name", "STRING", "REQUIRED"),
+    ("route_long_name", "STRING", "NULLABLE"),
+    ("route_type", "STRING", "NULLABLE"),
+    ("monday", "INTEGER", "REQUIRED"),
+    ("tuesday", "INTEGER", "REQUIRED"),
+    ("wednesday", "INTEGER", "REQUIRED"),
+    ("thursday", "INTEGER", "REQUIRED"),
+    ("friday", "INTEGER", "REQUIRED"),
+    ("saturday", "INTEGER", "REQUIRED"),
+    ("sunday", "INTEGER", "REQUIRED"),
+    ("start_date", "DATE", "REQUIRED"),
+    ("end_date", "DATE", "REQUIRED"),
+    ("arrival_time", "TIME", "REQUIRED"),
+    ("departure_time", "TIME", "REQUIRED"),
+    ("stop_id", "INTEGER", "REQUIRED"),
+    ("stop_sequence", "INTEGER", "REQUIRED"),
+    ("stop_headsign", "STRING", "NULLABLE"),
+    ("pickup_type", "INTEGER", "NULLABLE"),
+    ("drop_off_type", "INTEGER", "NULLABLE"),
+    ("shape_dist_traveled", "FLOAT64", "NULLABLE"),
+    ("timepoint", "INTEGER", "NULLABLE"),
+    ("stop_code", "INTEGER", "NULLABLE"),
+    ("stop_name", "STRING", "REQUIRED"),
+    ("stop_lat", "FLOAT64", "REQUIRED"),
+    ("stop_long", "FLOAT64", "REQUIRED"),
+    ("wheelchair_boarding", "NUMERIC", "NULLABLE"),
+    ("location_type", "STRING", "NULLABLE"),
+    ("parent_station", "STRING", "NULLABLE"),
+    ("platform_code", "STRING", "NULLABLE"),
+    ("id", "STRING", "REQUIRED"),
+    ("route_id_live", "INTEGER", "REQUIRED"),
+    ("start_time", "TIME", "REQUIRED"),
+    ("start_date_live", "STRING", "REQUIRED"),
+    ("latitude", "FLOAT64", "REQUIRED"),
+    ("longitude", "FLOAT64", "REQUIRED"),
+    ("current_stop", "INTEGER", "REQUIRED"),
+    ("current_status", "INTEGER", "NULLABLE"),
+    ("timestamp", "STRING", "REQUIRED"),
+    ("vehicle", "STRING", "REQUIRED"),
+    ("arrival_time_fixed", "STRING", "REQUIRED"),
+    ("departure_time_fixed", "STRING", "REQUIRED"),
+    ("time_diff", "FLOAT64", "REQUIRED"),
+]
+
+REQUIRED_FIELDS = [name for name, _, mode in LATE_BUSES_FIELDS if mode == "REQUIRED"]
+
+
+def late_buses_schema() -> list:
+    """BigQuery schema for the raw_late_buses table"""
+
+    from google.cloud.bigquery import SchemaField
+
+    return [
+        SchemaField(name, field_type=field_type, mode=mode)
+        for name, field_type, mode in LATE_BUSES_FIELDS
+    ]
@@ -1,38 +1,42 @@
 from datetime import datetime
-import pandas as pd
 import pytz
 import os
 from prefect import flow, task
-from prefect_gcp.cloud_storage import GcsBucket
 import requests
-from google.transit.gtfs_realtime_pb2 import FeedMessage
 from http import HTTPStatus
-from prefect.blocks.system import Secret
+from blocks import load_bods_api_key, load_gcs_bucket
 
 
-# For local env variable instead of Prefect Cloud
-# env_path = Path(".") / ".env"
-# load_dotenv(dotenv_path=env_path)
-# bods_api_key = os.environ["BODS_API"]
-
-secret_block = Secret.load("bods-api-key")
-bods_api_key = secret_block.get()
-
-
-@task(log_prints=True, retries=3)
+@task(log_prints=True, retries=3, retry_delay_seconds=10)
 def get_live_gtfs(
     min_lat: float, max_lat: float, min_long: float, max_long: float, filename: str
 ) -> None:
 
     """Get live bus locations from Open Bus Data GTFS feed for area specified by bounding box coordinates"""
 
-    url = f"https://data.bus-data.dft.gov.uk/api/v1/gtfsrtdatafeed/?boundingBox={min_lat},{max_lat},{min_long},{max_long}&api_key={bods_api_key}"
+    # Heavy imports are deferred to the task that uses them to keep cold starts fast
+    import pandas as pd
+    from google.transit.gtfs_realtime_pb2 import FeedMessage
+
+    api_key = load_bods_api_key()
+
+    url = f"https://data.bus-data.dft.gov.uk/api/v1/gtfsrtdatafeed/?boundingBox={min_lat},{max_lat},{min_long},{max_long}&api_key={api_key}"
+
+    response = requests.get(url, api_key)
+
+    # Fail (and retry) rather than parse an error response. The url holds the API key
+    # so it is left out of the message.
+    if response.status_code != HTTPStatus.OK:
+        raise requests.HTTPError(
+            f"GTFS live feed request failed with status {response.status_code}",
+            response=response,
+        )
 
-    response = requests.get(url, bods_api_key)
+    message = FeedMessage()
+    message.ParseFromString(response.content)
 
-    if response.status_code == HTTPStatus.OK:
-        message = FeedMessage()
-        message.ParseFromString(response.content)
+    if not message.entity:
+        raise ValueError("GTFS live feed returned no vehicles for the bounding box")
 
     trips = []
     for t in message.entity:
@@ -85,7 +89,7 @@ def load_live_locations_to_gcs(
 ) -> None:
     """Load the live bus locations to Google Bucket"""
 
-    gcs_block = GcsBucket.load(pref_gcs_block_name)
+    gcs_block = load_gcs_bucket(pref_gcs_block_name)
     gcs_block.upload_from_path(from_path=from_path, to_path=to_path)
 
     os.remove(from_path)
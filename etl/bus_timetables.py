@@ -1,18 +1,22 @@
 from datetime import datetime
-import gtfs_kit as gk
-import numpy as np
-import pandas as pd
 import pytz
 from prefect import flow, task
-from prefect_gcp.cloud_storage import GcsBucket
 import requests
 import os
+from typing import TYPE_CHECKING
+from blocks import load_gcs_bucket
+
+if TYPE_CHECKING:
+    import gtfs_kit as gk
+    import pandas as pd
 
 
 @task()
-def timetables_feed(timetable_url: str) -> gk.feed:
+def timetables_feed(timetable_url: str) -> "gk.feed":
     """Get latest timetable GTFS file from Open Bus Data service"""
 
+    import gtfs_kit as gk
+
     r = requests.get(timetable_url)
     with open("gtfs_timetables.zip", "wb") as fd:
         for chunk in r.iter_content(chunk_size=128):
@@ -26,13 +30,16 @@ def timetables_feed(timetable_url: str) -> gk.feed:
 
 
 @task()
-def add_stops_timetable(feed: gk.feed, agency_name: str) -> pd.DataFrame:
+def add_stops_timetable(feed: "gk.feed", agency_name: str) -> "pd.DataFrame":
     """Add stops and stop times to each trip for the selected operator"""
 
+    import pandas as pd
+
     # Get operator id
-    agency_id = feed.agency["agency_id"][
-        feed.agency["agency_name"] == agency_name
-    ].values[0]
+    agency_ids = feed.agency["agency_id"][feed.agency["agency_name"] == agency_name]
+    agency_id = agency_ids.values[0] if not agency_ids.empty else ""
+    if pd.isna(agency_id) or agency_id == "":
+        raise ValueError(f"No agency_id found for agency {agency_name!r}")
 
     # Find associated routes
     routes = feed.routes[feed.routes.agency_id == agency_id]
@@ -40,11 +47,8 @@ def add_stops_timetable(feed: gk.feed, agency_name: str) -> pd.DataFrame:
     # Join routes to trips
     trips = feed.trips
 
-    trips_routes = trips.merge(routes, how="left", on="route_id")
-
-    # Remove trips that aren't part of the selected operator
-    trips_routes["agency_id"].replace("", np.nan, inplace=True)
-    trips_routes.dropna(subset=["agency_id"], inplace=True)
+    # Inner join keeps only trips that are part of the selected operator
+    trips_routes = trips.merge(routes, how="inner", on="route_id")
 
     # Add calendar_dates of service
     cal_dates = feed.calendar
@@ -62,11 +66,11 @@ def add_stops_timetable(feed: gk.feed, agency_name: str) -> pd.DataFrame:
 
 
 @task()
-def timetable_today(
-    trips_stops: pd.DataFrame, current_trips_filename: str
-) -> pd.DataFrame:
+def timetable_today(trips_stops: "pd.DataFrame") -> "pd.DataFrame":
     """Transform all trip timetables to include only those running on the current (UK UTC) day"""
 
+    import pandas as pd
+
     tz = pytz.timezone("UTC")
     date_uk = datetime.now(tz)
 
@@ -88,6 +92,24 @@ def timetable_today(
     # If in service interval, check if trip is valid on the same day of week
     trips_today = trips_stops[trips_stops[current_day_uk] == 1]
 
+    return trips_today
+
+
+@task(log_prints=True)
+def validate_timetable_today(
+    trips_today: "pd.DataFrame", current_trips_filename: str, pref_gcs_block_name: str
+) -> "pd.DataFrame":
+    """Quarantine bad timetable rows so they never reach the current timetable"""
+
+    from validate import ValidationError, quarantine_to_gcs, validate_timetable
+
+    trips_today, quarantined = validate_timetable(trips_today)
+    if not quarantined.empty:
+        quarantine_to_gcs(quarantined, "timetable", pref_gcs_block_name)
+
+    if trips_today.empty:
+        raise ValidationError("No valid timetable rows for today")
+
     trips_today.to_parquet(f"{current_trips_filename}.parquet.gzip", compression="gzip")
 
     return trips_today
@@ -99,7 +121,7 @@ def load_timetable_to_gcs(
 ) -> None:
     """Load the trips today timetable to Google Bucket"""
 
-    gcs_block = GcsBucket.load(pref_gcs_block_name)
+    gcs_block = load_gcs_bucket(pref_gcs_block_name)
     gcs_block.upload_from_path(from_path=from_path, to_path=to_path)
 
     os.remove(from_path)
@@ -120,13 +142,15 @@ def get_bus_timetables(
     trips_stops = add_stops_timetable(
         wait_for=[full_timetable], feed=full_timetable, agency_name=agency_name
     )
-    trips_today = timetable_today(
-        wait_for=[trips_stops],
-        trips_stops=trips_stops,
+    trips_today = timetable_today(wait_for=[trips_stops], trips_stops=trips_stops)
+    valid_trips_today = validate_timetable_today(
+        wait_for=[trips_today],
+        trips_today=trips_today,
         current_trips_filename=current_timetable_filename,
+        pref_gcs_block_name=pref_gcs_block_name,
     )
     load_timetable_to_gcs(
-        wait_for=[trips_today],
+        wait_for=[valid_trips_today],
         pref_gcs_block_name=pref_gcs_block_name,
         from_path=f"{current_timetable_filename}.parquet.gzip",
         to_path=f"current_timetable/{current_timetable_filename}.parquet.gzip",
@@ -1,15 +1,13 @@
 from datetime import datetime
-import pandas as pd
 import pytz
 from prefect import flow, task
-from prefect_gcp.cloud_storage import GcsBucket
 from pathlib import Path
+from typing import TYPE_CHECKING, Tuple
 import os
+from blocks import load_gcs_bucket
 
-
-tz = pytz.timezone("UTC")
-now = datetime.now(tz)
-dt = now.replace(hour=0, minute=0, second=0, microsecond=0)
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @task(log_prints=True, retries=3)
@@ -19,7 +17,7 @@ def get_timetable_from_gcs(
     """Retrieve current timetable from bucket"""
 
     gcs_path = f"current_timetable/{current_timetable_filename}.parquet.gzip"
-    gcs_block = GcsBucket.load(pref_gcs_block_name)
+    gcs_block = load_gcs_bucket(pref_gcs_block_name)
     # Download timetable to cwd
     gcs_block.get_directory(from_path=gcs_path)
 
@@ -33,17 +31,55 @@ def get_live_locations_from_gcs(
     """Retrieve live locations from bucket"""
 
     gcs_path = f"live_location/{live_locations_filename}.parquet.gzip"
-    gcs_block = GcsBucket.load(pref_gcs_block_name)
+    gcs_block = load_gcs_bucket(pref_gcs_block_name)
     # Download live locations to cwd
     gcs_block.get_directory(from_path=gcs_path)
 
     return Path(gcs_path)
 
 
+@task(log_prints=True)
+def validate_inputs(
+    trips_today: "pd.DataFrame",
+    live_locations: "pd.DataFrame",
+    pref_gcs_block_name: str,
+) -> Tuple["pd.DataFrame", "pd.DataFrame"]:
+    """Quarantine bad live rows before they reach the merge"""
+
+    from validate import (
+        TIMETABLE_REQUIRED,
+        ValidationError,
+        check_schema,
+        quarantine_to_gcs,
+        split_operator,
+        validate_live_locations,
+    )
+
+    # The timetable is validated once a day in get_bus_timetables
+    check_schema(trips_today, TIMETABLE_REQUIRED, "timetable")
+
+    live_locations, other_operators = split_operator(
+        live_locations, trips_today["route_id"]
+    )
+    print(f"Dropped {len(other_operators)} live rows not on the operator's routes")
+
+    live_locations, quarantined = validate_live_locations(
+        live_locations, trips_today["trip_id"]
+    )
+    if not quarantined.empty:
+        quarantine_to_gcs(quarantined, "live_location", pref_gcs_block_name)
+
+    # Nothing to compare, so fail before the join, upload and BigQuery load
+    if live_locations.empty:
+        raise ValidationError("No valid live locations to compare with the timetable")
+
+    return trips_today, live_locations
+
+
 @task()
 def combine_live_trips_with_timetable(
-    trips_today: pd.DataFrame, live_locations: pd.DataFrame
-) -> pd.DataFrame:
+    trips_today: "pd.DataFrame", live_locations: "pd.DataFrame"
+) -> "pd.DataFrame":
     """Merge all scheduled timetable trips with live trip data"""
 
     compare = trips_today.merge(
@@ -56,9 +92,16 @@ def combine_live_trips_with_timetable(
 
 
 @task()
-def calculate_late_buses(compare: pd.DataFrame) -> pd.DataFrame:
+def calculate_late_buses(compare: "pd.DataFrame") -> "pd.DataFrame":
     """Calculate difference between bus scheduled time and actual live time"""
 
+    import pandas as pd
+
+    # Evaluated per run, a warm container may serve many runs after import
+    tz = pytz.timezone("UTC")
+    now = datetime.now(tz)
+    dt = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
     # Resolve times that flow over to next day (e.g. 26:00 hours)
     compare.loc[:, "arrival_time_fixed"] = dt + pd.to_timedelta(compare["arrival_time"])
     compare.loc[:, "departure_time_fixed"] = dt + pd.to_timedelta(
@@ -86,7 +129,7 @@ def calculate_late_buses(compare: pd.DataFrame) -> pd.DataFrame:
 def load_late_buses_to_gcs(late_buses_path: Path, pref_gcs_block_name: str) -> None:
     """Upload late buses to GCS"""
 
-    gcs_block = GcsBucket.load(pref_gcs_block_name)
+    gcs_block = load_gcs_bucket(pref_gcs_block_name)
     gcs_block.upload_from_path(from_path=late_buses_path)
 
     return None
@@ -99,6 +142,8 @@ def compare_bus_times(
     pref_gcs_block_name: str = "bus-tracker-gcs-bucket",
 ):
 
+    import pandas as pd
+
     trips_today_path = get_timetable_from_gcs(
         current_timetable_filename, pref_gcs_block_name
     )
@@ -109,15 +154,21 @@ def compare_bus_times(
     )
     live_locations = pd.read_parquet(live_locations_path)
 
+    os.remove(trips_today_path)
+    os.remove(live_locations_path)
+
+    trips_today, live_locations = validate_inputs(
+        trips_today=trips_today,
+        live_locations=live_locations,
+        pref_gcs_block_name=pref_gcs_block_name,
+    )
+
     compare = combine_live_trips_with_timetable(
         wait_for=[trips_today, live_locations],
         trips_today=trips_today,
         live_locations=live_locations,
     )
 
-    os.remove(trips_today_path)
-    os.remove(live_locations_path)
-
     late_buses = calculate_late_buses(wait_for=[compare], compare=compare)
     late_buses.to_csv("late_buses.csv", index=False)
 
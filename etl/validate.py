@@ -0,0 +1,221 @@
+from datetime import datetime
+from typing import Dict, List, Tuple
+import os
+import numpy as np
+import pandas as pd
+import pytz
+from blocks import load_gcs_bucket
+from bq_schema import LATE_BUSES_FIELDS, REQUIRED_FIELDS
+
+
+# Live feed columns, see get_live_gtfs. trip_id is shared with the timetable.
+LIVE_COLUMNS = [
+    "id",
+    "route_id_live",
+    "start_time",
+    "start_date_live",
+    "latitude",
+    "longitude",
+    "current_stop",
+    "current_status",
+    "timestamp",
+    "vehicle",
+]
+
+# Added by calculate_late_buses after the merge
+COMPUTED_COLUMNS = ["arrival_time_fixed", "departure_time_fixed", "time_diff"]
+
+# BigQuery fields named differently to the GTFS column loaded into them
+BQ_TO_GTFS = {"stop_long": "stop_lon"}
+
+# Columns that must be populated on every row, as each one is loaded into a
+# BigQuery REQUIRED field
+TIMETABLE_REQUIRED = [
+    BQ_TO_GTFS.get(c, c)
+    for c in REQUIRED_FIELDS
+    if c not in LIVE_COLUMNS + COMPUTED_COLUMNS
+]
+LIVE_REQUIRED = ["trip_id"] + [c for c in REQUIRED_FIELDS if c in LIVE_COLUMNS]
+
+# BigQuery field type of each input column
+FIELD_TYPES = {BQ_TO_GTFS.get(c, c): t for c, t, _ in LATE_BUSES_FIELDS}
+
+# GTFS times may run past midnight (e.g. 26:00:00)
+GTFS_TIME = r"\d{1,2}:[0-5]\d:[0-5]\d"
+
+QUARANTINE_REASON = "quarantine_reason"
+
+
+class ValidationError(ValueError):
+    """Raised when a feed can't be used at all, e.g. missing columns or no valid rows"""
+
+
+def check_schema(df: pd.DataFrame, required: List[str], name: str) -> None:
+    """Fail fast if any required column is missing"""
+
+    missing = [c for c in required if c not in df.columns]
+    if missing:
+        raise ValidationError(f"{name} is missing required columns: {missing}")
+
+
+def missing_values(df: pd.DataFrame, columns: List[str]) -> pd.Series:
+    """Rows with a null or empty string in any of the columns"""
+
+    values = df[columns]
+    # Only text columns can hold an empty string
+    empty = values.select_dtypes(include=["object", "string"]).eq("").any(axis=1)
+    return values.isna().any(axis=1) | empty
+
+
+def bad_time(times: pd.Series) -> pd.Series:
+    """Rows whose time is not a GTFS HH:MM:SS string"""
+
+    return ~times.astype(str).str.fullmatch(GTFS_TIME).astype(bool)
+
+
+def bad_integer(values: pd.Series) -> pd.Series:
+    """Rows that won't load into a BigQuery INTEGER field"""
+
+    numbers = pd.to_numeric(values, errors="coerce")
+    return numbers.isna() | numbers.mod(1).ne(0)
+
+
+def bad_float(values: pd.Series) -> pd.Series:
+    """Rows that won't load into a BigQuery FLOAT64 or NUMERIC field"""
+
+    return pd.to_numeric(values, errors="coerce").isna()
+
+
+def bad_date(values: pd.Series) -> pd.Series:
+    """Rows that won't load into a BigQuery DATE field"""
+
+    return pd.to_datetime(values, errors="coerce").isna()
+
+
+TYPE_CHECKS = {
+    "INTEGER": bad_integer,
+    "FLOAT64": bad_float,
+    "NUMERIC": bad_float,
+    "DATE": bad_date,
+}
+
+
+def bad_types(df: pd.DataFrame, columns: List[str]) -> Dict[str, pd.Series]:
+    """One check per BigQuery field type, flagging rows where any of the columns
+    of that type won't load"""
+
+    checks = {}
+    for field_type, check in TYPE_CHECKS.items():
+        typed = [c for c in columns if FIELD_TYPES.get(c) == field_type]
+        if typed:
+            checks[f"bad_{field_type.lower()}"] = df[typed].apply(check).any(axis=1)
+    return checks
+
+
+def bad_coordinates(lat: pd.Series, lon: pd.Series) -> pd.Series:
+    """Rows with coordinates out of range or left at the protobuf default of 0, 0"""
+
+    lat = pd.to_numeric(lat, errors="coerce")
+    lon = pd.to_numeric(lon, errors="coerce")
+    return ~lat.between(-90, 90) | ~lon.between(-180, 180) | ((lat == 0) & (lon == 0))
+
+
+def split_rows(
+    df: pd.DataFrame, checks: Dict[str, pd.Series]
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Split rows into valid and quarantined, tagging each bad row with the first check it failed"""
+
+    reasons = np.select(
+        [mask.to_numpy(dtype=bool) for mask in checks.values()],
+        list(checks.keys()),
+        default="",
+    )
+    bad = reasons != ""
+
+    quarantined = df[bad].copy()
+    quarantined[QUARANTINE_REASON] = reasons[bad]
+
+    return df[~bad], quarantined
+
+
+def validate_timetable(trips_today: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Check the current timetable for missing values, BigQuery types and malformed
+    stop times"""
+
+    check_schema(trips_today, TIMETABLE_REQUIRED, "timetable")
+
+    checks = {
+        "missing_required_value": missing_values(trips_today, TIMETABLE_REQUIRED),
+        **bad_types(trips_today, TIMETABLE_REQUIRED),
+        "bad_arrival_time": bad_time(trips_today["arrival_time"]),
+        "bad_departure_time": bad_time(trips_today["departure_time"]),
+    }
+    return split_rows(trips_today, checks)
+
+
+def split_operator(
+    live_locations: pd.DataFrame, route_ids: pd.Series
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Split live rows into those on the operator's routes and the rest
+
+    The bounding box feed holds every operator's vehicles, so rows on other
+    routes (or with no route) are expected and not bad data.
+    """
+
+    on_route = live_locations["route_id_live"].astype(str).isin(route_ids.astype(str))
+    return live_locations[on_route], live_locations[~on_route]
+
+
+def validate_live_locations(
+    live_locations: pd.DataFrame, trip_ids: pd.Series
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Check the operator's live locations for missing values, BigQuery types, bad
+    ranges and formats, and trip_ids that aren't in the timetable"""
+
+    check_schema(live_locations, LIVE_REQUIRED, "live locations")
+
+    current_stop = pd.to_numeric(live_locations["current_stop"], errors="coerce")
+
+    checks = {
+        "missing_required_value": missing_values(live_locations, LIVE_REQUIRED),
+        **bad_types(live_locations, LIVE_REQUIRED),
+        "bad_coordinates": bad_coordinates(
+            live_locations["latitude"], live_locations["longitude"]
+        ),
+        "bad_start_time": bad_time(live_locations["start_time"]),
+        # Stop sequences start at 1, so 0 is the protobuf default for unset
+        "bad_current_stop": current_stop.isna() | current_stop.le(0),
+        "unknown_trip_id": ~live_locations["trip_id"].isin(trip_ids),
+    }
+    return split_rows(live_locations, checks)
+
+
+def quarantine_to_gcs(
+    quarantined: pd.DataFrame, name: str, pref_gcs_block_name: str
+) -> None:
+    """Upload rows that failed validation to the quarantine folder of the bucket
+
+    This is a side output, so a failed upload is logged rather than failing the run.
+    """
+
+    print(
+        f"Quarantined {len(quarantined)} {name} rows:",
+        quarantined[QUARANTINE_REASON].value_counts().to_dict(),
+    )
+
+    run_time = datetime.now(pytz.timezone("UTC")).strftime("%Y%m%dT%H%M%S")
+    from_path = f"quarantine_{name}.parquet.gzip"
+
+    try:
+        quarantined.to_parquet(from_path, compression="gzip")
+        gcs_block = load_gcs_bucket(pref_gcs_block_name)
+        gcs_block.upload_from_path(
+            from_path=from_path, to_path=f"quarantine/{name}/{run_time}.parquet.gzip"
+        )
+    except Exception as e:
+        print(f"Failed to upload quarantined {name} rows: {e!r}")
+    finally:
+        if os.path.exists(from_path):
+            os.remove(from_path)
+
+    return None
@@ -0,0 +1,145 @@
+import pandas as pd
+import pytest
+from validate import (
+    LIVE_REQUIRED,
+    QUARANTINE_REASON,
+    TIMETABLE_REQUIRED,
+    ValidationError,
+    bad_time,
+    split_operator,
+    split_rows,
+    validate_live_locations,
+    validate_timetable,
+)
+
+
+def timetable(**columns) -> pd.DataFrame:
+    rows = len(next(iter(columns.values()), ["x"]))
+    df = pd.DataFrame({c: ["1"] * rows for c in TIMETABLE_REQUIRED}).assign(
+        arrival_time="08:00:00",
+        departure_time="08:00:00",
+        start_date=pd.Timestamp("2026-01-01"),
+        end_date=pd.Timestamp("2026-12-31"),
+    )
+    return df.assign(**columns)
+
+
+def live(**columns) -> pd.DataFrame:
+    rows = len(next(iter(columns.values()), ["x"]))
+    df = pd.DataFrame(
+        {
+            "id": [str(i) for i in range(rows)],
+            "trip_id": ["t1"] * rows,
+            "route_id_live": ["5"] * rows,
+            "start_time": ["08:00:00"] * rows,
+            "start_date_live": ["20260101"] * rows,
+            "latitude": [53.8] * rows,
+            "longitude": [-1.5] * rows,
+            "current_stop": [3] * rows,
+            "current_status": [2] * rows,
+            "timestamp": [pd.Timestamp("2026-01-01", tz="UTC")] * rows,
+            "vehicle": ["v1"] * rows,
+        }
+    )
+    return df.assign(**columns)
+
+
+def test_required_columns_follow_bigquery_schema():
+    assert "block_id" in TIMETABLE_REQUIRED
+    assert "stop_lon" in TIMETABLE_REQUIRED
+    assert "time_diff" not in TIMETABLE_REQUIRED
+    assert "route_id_live" not in TIMETABLE_REQUIRED
+    assert "trip_id" in LIVE_REQUIRED and "vehicle" in LIVE_REQUIRED
+
+
+def test_times_past_midnight_are_valid():
+    times = pd.Series(["26:00:00", "7:05:00", "7:5:00", "07:60:00", ""])
+    assert bad_time(times).tolist() == [False, False, True, True, True]
+
+
+def test_timetable_quarantines_malformed_times():
+    df = timetable(
+        arrival_time=["26:00:00", "7:5:00"], departure_time=["26:00:00", "07:05:00"]
+    )
+    valid, quarantined = validate_timetable(df)
+    assert len(valid) == 1
+    assert quarantined[QUARANTINE_REASON].tolist() == ["bad_arrival_time"]
+
+
+def test_missing_column_fails_fast():
+    with pytest.raises(ValidationError):
+        validate_timetable(timetable().drop(columns="block_id"))
+
+
+def test_protobuf_defaults_are_quarantined():
+    df = live(
+        trip_id=["t1", "", "t1"],
+        start_time=["08:00:00", "08:00:00", ""],
+        latitude=[0.0, 53.8, 53.8],
+        longitude=[0.0, -1.5, -1.5],
+    )
+    valid, quarantined = validate_live_locations(df, pd.Series(["t1"]))
+    assert valid.empty
+    assert quarantined[QUARANTINE_REASON].tolist() == [
+        "bad_coordinates",
+        "missing_required_value",
+        "missing_required_value",
+    ]
+
+
+def test_first_failed_check_is_the_reason():
+    df = live(trip_id=["t1", "t2"], start_time=["8am", "8am"])
+    _, quarantined = validate_live_locations(df, pd.Series(["t1"]))
+    # Row 2 fails both checks but is tagged with the earlier one
+    assert quarantined[QUARANTINE_REASON].tolist() == [
+        "bad_start_time",
+        "bad_start_time",
+    ]
+
+    df = live(trip_id=["t1", "t2"])
+    valid, quarantined = validate_live_locations(df, pd.Series(["t1"]))
+    assert valid["trip_id"].tolist() == ["t1"]
+    assert quarantined[QUARANTINE_REASON].tolist() == ["unknown_trip_id"]
+
+
+def test_unset_current_stop_is_quarantined():
+    df = live(current_stop=[3, 0])
+    valid, quarantined = validate_live_locations(df, pd.Series(["t1"]))
+    assert valid["current_stop"].tolist() == [3]
+    assert quarantined[QUARANTINE_REASON].tolist() == ["bad_current_stop"]
+
+
+def test_values_that_wont_load_into_bigquery_types_are_quarantined():
+    df = timetable(
+        stop_sequence=["1", "x", "1", "1"],
+        route_id=["5", "5", "5.5", "5"],
+        stop_lat=["53.8", "53.8", "53.8", "north"],
+    )
+    valid, quarantined = validate_timetable(df)
+    assert len(valid) == 1
+    assert quarantined[QUARANTINE_REASON].tolist() == [
+        "bad_integer",
+        "bad_integer",
+        "bad_float64",
+    ]
+
+    df = timetable(end_date=["not a date"])
+    _, quarantined = validate_timetable(df)
+    assert quarantined[QUARANTINE_REASON].tolist() == ["bad_date"]
+
+
+def test_other_operators_are_dropped_not_quarantined():
+    df = live(route_id_live=["5", "99", ""], trip_id=["t1", "other", ""])
+    operator, others = split_operator(df, pd.Series(["5"]))
+    assert operator["trip_id"].tolist() == ["t1"]
+    assert len(others) == 2
+
+
+def test_empty_frames_pass_through():
+    df = live().iloc[0:0]
+    valid, quarantined = split_rows(df, {"never": pd.Series([], dtype=bool)})
+    assert valid.empty and quarantined.empty
+    assert QUARANTINE_REASON in quarantined.columns
+
+    valid, quarantined = validate_live_locations(df, pd.Series(["t1"]))
+    assert valid.empty and quarantined.empty